@@ -1,21 +1,18 @@
-
 import pandas as pd
 
+# Renamed categories, matched against each comma-separated part
+CATEGORY_FIXES = {
+    "TRTR Curated": "The Apothecary Cabinet",
+    "Labz": "Curated Labz",
+}
+
 def normalize_multi_category_cell(cat):
     if pd.isna(cat) or not isinstance(cat, str):
         return cat
 
     cat = cat.replace("\\", "").strip()
     parts = [c.strip() for c in cat.split(",") if c.strip()]
-    fixed_parts = []
-
-    for p in parts:
-        if p == "TRTR Curated":
-            fixed_parts.append("The Apothecary Cabinet")
-        elif p == "Labz":
-            fixed_parts.append("Curated Labz")
-        else:
-            fixed_parts.append(p)
+    fixed_parts = [CATEGORY_FIXES.get(p, p) for p in parts]
 
     return ", ".join(sorted(set(fixed_parts)))
 
@@ -1,5 +1,6 @@
 
 import pandas as pd
+import xlsxwriter
 
 def safe_excel_write(df, file_path):
     '''
@@ -10,18 +11,26 @@ def safe_excel_write(df, file_path):
     # Clean column headers
     df.columns = df.columns.astype(str).str.strip()
 
-    # Strip whitespace, replace NaNs, and force everything to string
-    df_clean = df.fillna("").astype(str)
-    df_clean = df_clean.applymap(lambda x: x.strip() if isinstance(x, str) else x)
+    # Ensure no duplicate columns; skip the subset copy when there are none
+    dup_mask = df.columns.duplicated()
+    if dup_mask.any():
+        df = df.loc[:, ~dup_mask]
 
     # Drop unnamed or duplicate index columns, if present
-    if "Unnamed: 0" in df_clean.columns:
-        df_clean.drop(columns=["Unnamed: 0"], inplace=True)
-
-    # Ensure no duplicate columns
-    df_clean = df_clean.loc[:, ~df_clean.columns.duplicated()]
+    if "Unnamed: 0" in df.columns:
+        df = df.drop(columns=["Unnamed: 0"])
 
-    # Export cleanly
-    df_clean.to_excel(file_path, index=False)
+    # Strip whitespace, replace NaNs, and force everything to string
+    df_clean = df.astype(object).where(df.notna(), "").astype(str)
+    df_clean = df_clean.apply(lambda col: col.str.strip())
+
+    # Export cleanly, streaming rows to disk with xlsxwriter; rows go out in
+    # order because constant_memory can't revisit a finished row
+    with xlsxwriter.Workbook(file_path, {"constant_memory": True, "strings_to_urls": False}) as workbook:
+        worksheet = workbook.add_worksheet()
+        header_format = workbook.add_format({"bold": True, "border": 1, "align": "center"})
+        worksheet.write_row(0, 0, df_clean.columns, header_format)
+        for row_idx, row in enumerate(df_clean.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, row)
 
     print(f"✅ Safe export complete: {file_path}")
@@ -1,5 +1,6 @@
 
 import pandas as pd
+from validate_square_headers import open_workbook
 
 REQUIRED_COLUMNS = {
     "Reference Handle", "Token", "Item Name", "Variation Name", "SKU", "Description",
@@ -14,9 +15,10 @@ REQUIRED_VALUES = {
     "Item Type": "Physical"
 }
 
-def validate_values(file_path):
-    print(f"📄 Validating import file: {file_path}")
-    df = pd.read_excel(file_path)
+def validate_values(source, name=None):
+    print(f"📄 Validating import file: {name or source}")
+    with open_workbook(source) as xf:
+        df = pd.read_excel(xf, sheet_name=0, usecols=lambda c: c in REQUIRED_COLUMNS)
     errors = []
 
     # Check headers
@@ -27,9 +29,9 @@ def validate_values(file_path):
     # Check values
     for field, expected in REQUIRED_VALUES.items():
         if field in df.columns:
-            values = df[field].dropna().astype(str).str.strip().unique()
-            if expected not in values:
-                errors.append(f"❌ Expected '{expected}' in '{field}', found {list(values)}")
+            values = df[field].dropna().astype(str).str.strip()
+            if not (values == expected).any():
+                errors.append(f"❌ Expected '{expected}' in '{field}', found {list(values.unique())}")
         else:
             errors.append(f"❌ Missing expected column '{field}'")
 
@@ -39,4 +41,10 @@ def validate_values(file_path):
         print("✅ All required fields and values are correct.")
 
 if __name__ == "__main__":
-    validate_values("your_square_file.xlsx")
+    from validate_square_headers import validate_square_import
+
+    # Open the workbook once and run both checks against it
+    file_path = "your_square_file.xlsx"
+    with pd.ExcelFile(file_path, engine="calamine") as xf:
+        validate_square_import(xf, name=file_path)
+        validate_values(xf, name=file_path)
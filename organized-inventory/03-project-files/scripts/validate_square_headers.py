@@ -1,5 +1,7 @@
 
 import pandas as pd
+from collections import Counter
+from contextlib import nullcontext
 
 # Define required Square fields (adjustable based on actual needs)
 REQUIRED_FIELDS = {
@@ -19,13 +21,23 @@ REQUIRED_FIELDS = {
     "Square Online Item Visibility"
 }
 
-def validate_square_import(file_path):
-    print(f"🔍 Validating: {file_path}")
-    df = pd.read_excel(file_path)
-    headers = list(df.columns)
+# Accept a path or an already-open pd.ExcelFile shared with other
+# validators; only a workbook opened here is closed here
+def open_workbook(source):
+    if isinstance(source, pd.ExcelFile):
+        return nullcontext(source)
+    return pd.ExcelFile(source, engine="calamine")
+
+def validate_square_import(source, name=None):
+    print(f"🔍 Validating: {name or source}")
+    with open_workbook(source) as xf:
+        # Only the header row is needed, read raw so duplicate names aren't
+        # renamed to "X.1" before they can be counted
+        header_row = pd.read_excel(xf, sheet_name=0, header=None, nrows=1)
+    headers = [h for h in header_row.iloc[0] if pd.notna(h)] if len(header_row) else []
 
     # Check for duplicates
-    duplicates = set([x for x in headers if headers.count(x) > 1])
+    duplicates = {h for h, count in Counter(headers).items() if count > 1}
 
     # Check for missing required fields
     missing = REQUIRED_FIELDS - set(headers)
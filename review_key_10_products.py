@@ -1,10 +1,11 @@
 import pandas as pd
 import json
 import warnings
+from scripts.utilities.catalog_cache import load_catalog
 warnings.filterwarnings('ignore')
 
-# Load the merged catalog
-df = pd.read_excel('organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx')
+# Load the merged catalog (cached as Parquet after the first read)
+df = load_catalog('organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx')
 
 print("=== DETAILED REVIEW OF 10 KEY PRODUCTS ===\n")
 
@@ -22,15 +23,21 @@ key_products = [
     "The Rider Waite Purple Neon Foil Tarot Deck"
 ]
 
+# Index lowercase names once so each lookup is a dict hit (first row wins)
+names_lower = df['Item Name'].str.lower().str.strip()
+first_rows = names_lower.dropna().drop_duplicates()
+idx_by_name = dict(zip(first_rows, first_rows.index))
+
 for i, product_name in enumerate(key_products, 1):
     # Find product
-    mask = df['Item Name'] == product_name
-    if not mask.any():
-        # Try partial match
-        mask = df['Item Name'].str.contains(product_name[:30], case=False, na=False)
+    idx = idx_by_name.get(product_name.lower().strip())
+    if idx is None:
+        # Try partial match on the name prefix
+        matches = names_lower.index[names_lower.str.startswith(product_name[:30].lower(), na=False)]
+        idx = matches[0] if len(matches) else None
     
-    if mask.any():
-        prod = df[mask].iloc[0]
+    if idx is not None:
+        prod = df.loc[idx]
         print(f"\n{'='*80}")
         print(f"#{i}. {prod['Item Name']}")
         print(f"{'='*80}")
@@ -1,9 +1,14 @@
 import pandas as pd
+import re
 import warnings
+from scripts.utilities.catalog_cache import load_catalog
 warnings.filterwarnings('ignore')
 
-# Load the merged catalog
-df = pd.read_excel('organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx')
+# Load the merged catalog (cached as Parquet after the first read)
+df = load_catalog(
+    'organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx',
+    columns=['Item Name', 'Price', 'SEO Title', 'SEO Description', 'Categories'],
+)
 
 print("=== KEY PRODUCT REVIEW ===\n")
 print(f"Total products in catalog: {len(df)}\n")
@@ -12,11 +17,18 @@ print(f"Total products in catalog: {len(df)}\n")
 print("1. LOOKING FOR KEY PRODUCTS:")
 search_terms = ['Selenite', 'Chakra', 'Rose Candle', 'Crystal Singing Bowl', 'Tarot']
 
+# One case-insensitive regex pass finds every term in every name
+pattern = '(?i)(' + '|'.join(map(re.escape, search_terms)) + ')'
+hits = df['Item Name'].str.extractall(pattern)[0].str.lower().droplevel('match')
+hits = hits.rename('term').reset_index().drop_duplicates()
+hit_counts = hits.groupby('term').size()
+hit_samples = hits.groupby('term').head(3)
+
 for term in search_terms:
-    matches = df[df['Item Name'].str.contains(term, case=False, na=False)]
-    print(f"\n{term} products: {len(matches)}")
-    for idx, prod in matches.head(3).iterrows():
-        print(f"  - {prod['Item Name']}")
+    key = term.lower()
+    print(f"\n{term} products: {hit_counts.get(key, 0)}")
+    for idx in hit_samples.loc[hit_samples['term'] == key, 'index']:
+        print(f"  - {df.at[idx, 'Item Name']}")
 
 # 2. High-value items
 print("\n\n2. HIGH-VALUE ITEMS (OVER $75):")
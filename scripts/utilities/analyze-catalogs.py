@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 
 import pandas as pd
+import numpy as np
 import os
 from datetime import datetime
 import re
 from pathlib import Path
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from python_calamine import CalamineWorkbook
 
 # Define paths
 project_root = Path(__file__).parent.parent.parent
@@ -12,70 +16,95 @@ organized_exports = project_root / "organized-inventory/02-inventory/exports"
 exports_dir = project_root / "exports"
 root_dir = project_root
 
-# Collect all Excel files
-excel_files = []
-
-# From organized exports
-for file in organized_exports.glob("*.xlsx"):
-    excel_files.append(("organized_exports", file))
-
-# From exports directory
-for file in exports_dir.glob("**/*.xlsx"):
-    excel_files.append(("exports", file))
-
-# From root directory
-for file in root_dir.glob("*.xlsx"):
-    if file.name not in ["pnpm-lock.yaml", "pnpm-workspace.yaml"]:
-        excel_files.append(("root", file))
-
-print("=" * 80)
-print("SQUARE CATALOG ANALYSIS - COMPREHENSIVENESS & RECENCY")
-print("=" * 80)
-
-# Store analysis results
-results = []
-
-for location, file_path in excel_files:
+# Only these columns (plus per-location "Enabled" flags) feed the analysis
+NEEDED_COLUMNS = ["Item Name", "Reference Handle", "SEO Title", "Description", "Categories"]
+
+# Date stamp embedded in export filenames
+DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Store filename markers; alternatives are tried in order, so an earlier
+# store wins when a filename contains more than one marker
+STORE_NAMES = ['TBDLabz', 'Palka', 'TRTR', 'Square Exports']
+STORE_RE = re.compile(r'^(?:.*?(TBDL)|.*?(Palka)|.*?(TRTR)|.*?(7MM9AFJAD0XHW))')
+
+def classify_store(file_name):
+    match = STORE_RE.match(file_name)
+    return STORE_NAMES[match.lastindex - 1] if match else 'Other'
+
+def is_location_column(col):
+    col = str(col)
+    return 'Enabled' in col and ('Richmond' in col or 'McHenry' in col)
+
+def scan_xlsx(directory, recursive=False):
+    # Yield (path, stat) for .xlsx files; DirEntry reuses the directory listing
+    if not directory.is_dir():
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if recursive and entry.is_dir(follow_symlinks=False):
+                yield from scan_xlsx(Path(entry.path), recursive=True)
+            elif entry.is_file() and entry.name.endswith('.xlsx'):
+                yield Path(entry.path), entry.stat()
+
+def analyze_file(loc_path):
+    location, file_path, file_stat = loc_path
     try:
         # Get file stats
-        file_stat = os.stat(file_path)
         file_size_kb = file_stat.st_size / 1024
         modified_time = datetime.fromtimestamp(file_stat.st_mtime)
         
         # Try to extract date from filename
-        date_pattern = r'(\d{4}-\d{2}-\d{2})'
-        date_match = re.search(date_pattern, file_path.name)
+        date_match = DATE_RE.search(file_path.name)
         filename_date = date_match.group(1) if date_match else None
         
-        # Read Excel file
-        df = pd.read_excel(file_path)
-        
-        # Analyze content
-        total_rows = len(df)
+        # Stream the first sheet with calamine and count non-empty cells in
+        # the needed columns; no DataFrame is built for the whole workbook
+        sheet = CalamineWorkbook.from_path(str(file_path)).get_sheet_by_index(0)
+        rows = sheet.iter_rows()
+        header = next(rows, [])
+        column_index = {}
+        for i, col in enumerate(header):
+            column_index.setdefault(col, i)
+        tracked = {col: column_index[col] for col in NEEDED_COLUMNS if col in column_index}
+        handle_index = tracked.get('Reference Handle')
+
+        total_rows = 0
+        counts = Counter()
+        handles = set()
+        for row in rows:
+            # Blank rows are skipped, as pandas does
+            if all(cell == '' for cell in row):
+                continue
+            total_rows += 1
+            for col, i in tracked.items():
+                if row[i] != '':
+                    counts[col] += 1
+            if handle_index is not None and row[handle_index] != '':
+                handles.add(row[handle_index])
         
         # Count actual products (excluding empty rows)
-        if 'Item Name' in df.columns:
-            products_with_names = df['Item Name'].notna().sum()
+        if 'Item Name' in tracked:
+            products_with_names = counts['Item Name']
         else:
             products_with_names = total_rows
             
         # Count variations
-        unique_items = df['Reference Handle'].nunique() if 'Reference Handle' in df.columns else 0
+        unique_items = len(handles)
         
         # Check for SEO data
-        has_seo = 'SEO Title' in df.columns and df['SEO Title'].notna().sum() > 0
-        seo_count = df['SEO Title'].notna().sum() if 'SEO Title' in df.columns else 0
+        seo_count = counts['SEO Title']
+        has_seo = seo_count > 0
         
         # Check for descriptions
-        desc_count = df['Description'].notna().sum() if 'Description' in df.columns else 0
+        desc_count = counts['Description']
         
         # Check for categories
-        cat_count = df['Categories'].notna().sum() if 'Categories' in df.columns else 0
+        cat_count = counts['Categories']
         
         # Count locations enabled
-        location_columns = [col for col in df.columns if 'Enabled' in col and 'Richmond' in col or 'McHenry' in col]
+        location_columns = [col for col in header if is_location_column(col)]
         
-        results.append({
+        return {
             'file': file_path.name,
             'location': location,
             'size_kb': file_size_kb,
@@ -90,80 +119,100 @@ for location, file_path in excel_files:
             'cat_count': cat_count,
             'locations': len(location_columns),
             'path': str(file_path.relative_to(project_root))
-        })
+        }
         
     except Exception as e:
         print(f"Error reading {file_path.name}: {e}")
-
-# Sort by various criteria
-print("\n1. MOST RECENT FILES (by modification date):")
-print("-" * 60)
-sorted_by_date = sorted(results, key=lambda x: x['modified'], reverse=True)[:10]
-for r in sorted_by_date:
-    print(f"{r['modified'].strftime('%Y-%m-%d %H:%M')} - {r['file'][:50]:50} | {r['products']:,} products")
-
-print("\n2. LARGEST CATALOGS (by product count):")
-print("-" * 60)
-sorted_by_products = sorted(results, key=lambda x: x['products'], reverse=True)[:10]
-for r in sorted_by_products:
-    print(f"{r['products']:5,} products | {r['file'][:50]:50} | {r['size_kb']:.1f} KB")
-
-print("\n3. MOST COMPREHENSIVE (products with SEO + descriptions):")
-print("-" * 60)
-# Calculate comprehensiveness score
-for r in results:
-    r['completeness'] = (
-        (r['seo_count'] / r['products'] if r['products'] > 0 else 0) * 0.3 +
-        (r['desc_count'] / r['products'] if r['products'] > 0 else 0) * 0.3 +
-        (r['cat_count'] / r['products'] if r['products'] > 0 else 0) * 0.2 +
-        (min(r['products'] / 1000, 1)) * 0.2  # Size factor
+        return None
+
+def main():
+    # Collect all Excel files
+    excel_files = []
+
+    # From organized exports
+    for file, file_stat in scan_xlsx(organized_exports):
+        excel_files.append(("organized_exports", file, file_stat))
+
+    # From exports directory
+    for file, file_stat in scan_xlsx(exports_dir, recursive=True):
+        excel_files.append(("exports", file, file_stat))
+
+    # From root directory
+    for file, file_stat in scan_xlsx(root_dir):
+        if file.name not in ["pnpm-lock.yaml", "pnpm-workspace.yaml"]:
+            excel_files.append(("root", file, file_stat))
+
+    print("=" * 80)
+    print("SQUARE CATALOG ANALYSIS - COMPREHENSIVENESS & RECENCY")
+    print("=" * 80)
+
+    # Analyze files in parallel; each workbook parse is independent
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = [r for r in executor.map(analyze_file, excel_files) if r is not None]
+
+    if not results:
+        print("\nNo readable catalogs found.")
+        return
+    results = pd.DataFrame(results)
+
+    # Sort by various criteria
+    print("\n1. MOST RECENT FILES (by modification date):")
+    print("-" * 60)
+    sorted_by_date = results.nlargest(10, 'modified')
+    for r in sorted_by_date.to_dict('records'):
+        print(f"{r['modified'].strftime('%Y-%m-%d %H:%M')} - {r['file'][:50]:50} | {r['products']:,} products")
+
+    print("\n2. LARGEST CATALOGS (by product count):")
+    print("-" * 60)
+    sorted_by_products = results.nlargest(10, 'products')
+    for r in sorted_by_products.to_dict('records'):
+        print(f"{r['products']:5,} products | {r['file'][:50]:50} | {r['size_kb']:.1f} KB")
+
+    print("\n3. MOST COMPREHENSIVE (products with SEO + descriptions):")
+    print("-" * 60)
+    # Calculate comprehensiveness score (ratios are 0 for catalogs without products)
+    products = results['products'].where(results['products'] > 0)
+    results['completeness'] = (
+        (results['seo_count'] / products).fillna(0) * 0.3 +
+        (results['desc_count'] / products).fillna(0) * 0.3 +
+        (results['cat_count'] / products).fillna(0) * 0.2 +
+        np.clip(results['products'] / 1000, 0, 1) * 0.2  # Size factor
     )
 
-sorted_by_completeness = sorted(results, key=lambda x: x['completeness'], reverse=True)[:10]
-for r in sorted_by_completeness:
-    print(f"Score: {r['completeness']:.2f} | {r['file'][:40]:40} | {r['products']:,} items | SEO: {r['seo_count']:,}")
-
-print("\n4. CATALOG COMPARISON BY STORE:")
-print("-" * 60)
-# Group by store type
-stores = {
-    'TBDLabz': [],
-    'Palka': [],
-    'TRTR': [],
-    'Square Exports': [],
-    'Other': []
-}
-
-for r in results:
-    if 'TBDLabz' in r['file'] or 'TBDL' in r['file']:
-        stores['TBDLabz'].append(r)
-    elif 'Palka' in r['file']:
-        stores['Palka'].append(r)
-    elif 'TRTR' in r['file']:
-        stores['TRTR'].append(r)
-    elif '7MM9AFJAD0XHW' in r['file']:
-        stores['Square Exports'].append(r)
-    else:
-        stores['Other'].append(r)
-
-for store, files in stores.items():
-    if files:
-        print(f"\n{store}:")
-        sorted_files = sorted(files, key=lambda x: x['products'], reverse=True)[:3]
-        for f in sorted_files:
-            print(f"  - {f['file'][:45]:45} | {f['products']:,} products | {f['modified'].strftime('%Y-%m-%d')}")
-
-print("\n5. RECOMMENDED MOST RECENT & COMPREHENSIVE CATALOGS:")
-print("-" * 60)
-# Find best catalog per store
-for store, files in stores.items():
-    if files:
-        # Sort by completeness and recency
-        best = sorted(files, key=lambda x: (x['completeness'], x['modified']), reverse=True)[0]
-        print(f"\n{store}: {best['file']}")
-        print(f"  - Products: {best['products']:,}")
-        print(f"  - SEO Entries: {best['seo_count']:,}")
-        print(f"  - Last Modified: {best['modified'].strftime('%Y-%m-%d %H:%M')}")
-        print(f"  - Completeness Score: {best['completeness']:.2f}")
-
-print("\n" + "=" * 80)
+    sorted_by_completeness = results.nlargest(10, 'completeness')
+    for r in sorted_by_completeness.to_dict('records'):
+        print(f"Score: {r['completeness']:.2f} | {r['file'][:40]:40} | {r['products']:,} items | SEO: {r['seo_count']:,}")
+
+    print("\n4. CATALOG COMPARISON BY STORE:")
+    print("-" * 60)
+    # Group by store type
+    stores = {store: [] for store in STORE_NAMES + ['Other']}
+
+    for r in results.to_dict('records'):
+        stores[classify_store(r['file'])].append(r)
+
+    for store, files in stores.items():
+        if files:
+            print(f"\n{store}:")
+            sorted_files = sorted(files, key=lambda x: x['products'], reverse=True)[:3]
+            for f in sorted_files:
+                print(f"  - {f['file'][:45]:45} | {f['products']:,} products | {f['modified'].strftime('%Y-%m-%d')}")
+
+    print("\n5. RECOMMENDED MOST RECENT & COMPREHENSIVE CATALOGS:")
+    print("-" * 60)
+    # Find best catalog per store
+    for store, files in stores.items():
+        if files:
+            # Sort by completeness and recency
+            best = sorted(files, key=lambda x: (x['completeness'], x['modified']), reverse=True)[0]
+            print(f"\n{store}: {best['file']}")
+            print(f"  - Products: {best['products']:,}")
+            print(f"  - SEO Entries: {best['seo_count']:,}")
+            print(f"  - Last Modified: {best['modified'].strftime('%Y-%m-%d %H:%M')}")
+            print(f"  - Completeness Score: {best['completeness']:.2f}")
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    main()
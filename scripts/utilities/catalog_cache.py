@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import pandas as pd
+import numpy as np
+import xlsxwriter
+from pathlib import Path
+
+# Rows converted to Python objects at a time when streaming a workbook out
+WRITE_CHUNK_ROWS = 10_000
+
+# Load a catalog workbook, caching it as Parquet next to the .xlsx.
+# The cache is reused while it is at least as new as the workbook, so
+# repeat runs skip the Excel parse entirely. Sheets read with a header
+# row other than the first get their own cache file.
+def load_catalog(xlsx_path, columns=None, header=0):
+    xlsx_path = Path(xlsx_path)
+    cache_path = xlsx_path.with_suffix('.parquet' if header == 0 else f'.header{header}.parquet')
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= xlsx_path.stat().st_mtime:
+        return pd.read_parquet(cache_path, columns=columns)
+
+    df = pd.read_excel(xlsx_path, header=header, engine="calamine")
+    _write_cache(df, xlsx_path, cache_path)
+
+    return df if columns is None else df[columns]
+
+# Write a DataFrame to a workbook with xlsxwriter in constant-memory mode.
+# constant_memory only keeps the current row and to_excel writes column by
+# column, so rows are written here in order instead. Headers, dates and
+# infinities are written the way to_excel writes them.
+def write_xlsx_rows(df, xlsx_path):
+    options = {"constant_memory": True, "default_date_format": "yyyy-mm-dd hh:mm:ss"}
+
+    with xlsxwriter.Workbook(str(xlsx_path), options) as workbook:
+        worksheet = workbook.add_worksheet()
+        header_format = workbook.add_format({"bold": True, "border": 1, "align": "center"})
+        worksheet.write_row(0, 0, df.columns, header_format)
+        for start in range(0, len(df), WRITE_CHUNK_ROWS):
+            chunk = df.iloc[start:start + WRITE_CHUNK_ROWS]
+            # xlsxwriter can't store infinities as numbers
+            chunk = chunk.astype(object).replace([np.inf, -np.inf], ["inf", "-inf"])
+            chunk = chunk.where(chunk.notna(), None)
+            for row_idx, row in enumerate(chunk.itertuples(index=False, name=None), start=start + 1):
+                worksheet.write_row(row_idx, 0, row)
+
+# Write a catalog workbook, then its Parquet cache
+def save_catalog(df, xlsx_path):
+    xlsx_path = Path(xlsx_path)
+    write_xlsx_rows(df, xlsx_path)
+
+    # Written after the workbook so load_catalog() treats it as fresh. Store
+    # what a cold read of the workbook returns: categoricals (a merge-time
+    # detail) as plain strings, and empty strings as the blank cells they became
+    df = df.reset_index(drop=True)
+    df = df.astype({col: object for col in df.select_dtypes('category').columns})
+    text_columns = df.select_dtypes(include=['object', 'string']).columns
+    df[text_columns] = df[text_columns].mask(df[text_columns].eq(''))
+    _write_cache(df, xlsx_path, xlsx_path.with_suffix('.parquet'))
+
+def _write_cache(df, xlsx_path, cache_path):
+    try:
+        df.to_parquet(cache_path)
+    except (TypeError, ValueError) as e:
+        # Mixed-type columns can't always be stored; fall back to no cache
+        print(f"Could not cache {xlsx_path.name} as Parquet: {e}")
+        cache_path.unlink(missing_ok=True)
@@ -4,171 +4,134 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import warnings
+from catalog_cache import load_catalog, save_catalog
 warnings.filterwarnings('ignore')
 
 print("Creating Comprehensive Merged Catalog...")
 print("="*80)
 
-# Load all catalogs
-square_df = pd.read_excel('exports/7MM9AFJAD0XHW_catalog-2025-08-03-1627.xlsx', header=1)
-palka_df = pd.read_excel('Palka_Store_SEO_Enriched_Final.xlsx')
-tbd_df = pd.read_excel('organized-inventory/02-inventory/exports/TBDLabz_Catalog_All_Updated_Final.xlsx')
+# Load all catalogs (cached as Parquet after the first read)
+square_df = load_catalog('exports/7MM9AFJAD0XHW_catalog-2025-08-03-1627.xlsx', header=1)
+palka_df = load_catalog('Palka_Store_SEO_Enriched_Final.xlsx')
+tbd_df = load_catalog('organized-inventory/02-inventory/exports/TBDLabz_Catalog_All_Updated_Final.xlsx')
 
-# Create merged catalog using Square's structure as base
-merged_catalog = []
+# Only these columns take part in the merge; the rest are re-joined at write time
+MERGE_COLUMNS = ['Item Name', 'Description', 'SEO Title', 'SEO Description', 'Categories']
+catalogs = {'square': square_df, 'palka': palka_df, 'tbd': tbd_df}
 
-# Function to clean and standardize product names
-def clean_name(name):
-    if pd.isna(name):
-        return ""
-    return str(name).lower().strip()
-
-# Function to evaluate description quality
+# Function to evaluate description quality for a whole column
 def evaluate_description(desc):
-    if pd.isna(desc) or str(desc) == 'nan' or not desc:
-        return 0
-    desc_str = str(desc)
-    score = len(desc_str)
+    desc_str = desc.astype('string').fillna('')
+    length = desc_str.str.len()
+    score = length.copy()
     # Bonus for complete sentences
-    if '.' in desc_str:
-        score += 50
+    score += np.where(desc_str.str.contains('.', regex=False), 50, 0)
     # Bonus for detailed descriptions
-    if len(desc_str) > 100:
-        score += 100
-    return score
+    score += np.where(length > 100, 100, 0)
+    # Empty descriptions score nothing
+    return score.where(length > 0, 0).astype(int)
 
-# Function to evaluate SEO quality
+# Function to evaluate SEO quality for whole title/description columns
 def evaluate_seo(title, desc):
     score = 0
-    if not pd.isna(title) and str(title) != 'nan':
-        score += 100 + len(str(title))
-    if not pd.isna(desc) and str(desc) != 'nan':
-        score += 100 + len(str(desc))
+    for col in (title, desc):
+        score += (100 + col.astype('string').str.len()).where(col.notna(), 0).astype(int)
     return score
 
+# Narrow each catalog to the merge columns and score every row once
+merge_inputs = {}
+for source, df in catalogs.items():
+    # Catalogs missing a merge column get it as NaN, which scores 0
+    merge_df = df.reindex(columns=MERGE_COLUMNS).assign(_row=df.index)
+    merge_df['_desc_score'] = evaluate_description(merge_df['Description'])
+    merge_df['_seo_score'] = evaluate_seo(merge_df['SEO Title'], merge_df['SEO Description'])
+    merge_inputs[source] = merge_df
+
 # Process each unique product
 print("\nProcessing products for merge...")
 
-# First, index all products by cleaned name
-product_index = {}
-
-# Index Square products
-for idx, row in square_df.iterrows():
-    name = clean_name(row.get('Item Name', ''))
-    if name:
-        if name not in product_index:
-            product_index[name] = {'square': [], 'palka': [], 'tbd': []}
-        product_index[name]['square'].append(row)
-
-# Index Palka products
-for idx, row in palka_df.iterrows():
-    name = clean_name(row.get('Item Name', ''))
-    if name:
-        if name not in product_index:
-            product_index[name] = {'square': [], 'palka': [], 'tbd': []}
-        product_index[name]['palka'].append(row)
-
-# Index TBD products
-for idx, row in tbd_df.iterrows():
-    name = clean_name(row.get('Item Name', ''))
-    if name:
-        if name not in product_index:
-            product_index[name] = {'square': [], 'palka': [], 'tbd': []}
-        product_index[name]['tbd'].append(row)
-
-# Manual merge decisions
-merge_count = 0
-products_processed = 0
-
-for product_name, sources in sorted(product_index.items()):
-    products_processed += 1
-    
-    # Get best data from each source
-    best_square = sources['square'][0] if sources['square'] else None
-    best_palka = sources['palka'][0] if sources['palka'] else None
-    best_tbd = sources['tbd'][0] if sources['tbd'] else None
-    
-    # Start with the most complete base (usually Square for structure)
-    if best_square is not None:
-        merged_row = best_square.copy()
-    elif best_palka is not None:
-        merged_row = best_palka.copy()
-    elif best_tbd is not None:
-        merged_row = best_tbd.copy()
-    else:
-        continue
-    
-    # Manual selection of best data
-    merge_notes = []
-    
-    # DESCRIPTION - Choose the best one
-    descriptions = {
-        'square': (best_square.get('Description', '') if best_square is not None else ''),
-        'palka': (best_palka.get('Description', '') if best_palka is not None else ''),
-        'tbd': (best_tbd.get('Description', '') if best_tbd is not None else '')
-    }
-    
-    desc_scores = {k: evaluate_description(v) for k, v in descriptions.items()}
-    best_desc_source = max(desc_scores, key=desc_scores.get)
-    
-    if desc_scores[best_desc_source] > 0:
-        merged_row['Description'] = descriptions[best_desc_source]
-        merge_notes.append(f"desc:{best_desc_source}")
-    
-    # SEO TITLE & DESCRIPTION - Choose the best set
-    seo_data = {
-        'square': {
-            'title': best_square.get('SEO Title', '') if best_square is not None else '',
-            'desc': best_square.get('SEO Description', '') if best_square is not None else ''
-        },
-        'palka': {
-            'title': best_palka.get('SEO Title', '') if best_palka is not None else '',
-            'desc': best_palka.get('SEO Description', '') if best_palka is not None else ''
-        },
-        'tbd': {
-            'title': best_tbd.get('SEO Title', '') if best_tbd is not None else '',
-            'desc': best_tbd.get('SEO Description', '') if best_tbd is not None else ''
-        }
-    }
-    
-    seo_scores = {k: evaluate_seo(v['title'], v['desc']) for k, v in seo_data.items()}
-    best_seo_source = max(seo_scores, key=seo_scores.get)
-    
-    if seo_scores[best_seo_source] > 0:
-        merged_row['SEO Title'] = seo_data[best_seo_source]['title']
-        merged_row['SEO Description'] = seo_data[best_seo_source]['desc']
-        merge_notes.append(f"seo:{best_seo_source}")
-    
-    # CATEGORIES - Prefer Palka's curated categories if available
-    if best_palka is not None and not pd.isna(best_palka.get('Categories', '')):
-        merged_row['Categories'] = best_palka.get('Categories', '')
-        merge_notes.append("cat:palka")
-    elif best_square is not None and not pd.isna(best_square.get('Categories', '')):
-        merged_row['Categories'] = best_square.get('Categories', '')
-        merge_notes.append("cat:square")
-    
-    # Add merge metadata
-    merged_row['_merge_sources'] = ', '.join([k for k, v in sources.items() if v])
-    merged_row['_merge_notes'] = ', '.join(merge_notes)
-    
-    merged_catalog.append(merged_row)
-    
-    if len(sources['square']) + len(sources['palka']) + len(sources['tbd']) > 1:
-        merge_count += 1
-    
-    # Show progress every 50 products
-    if products_processed % 50 == 0:
-        print(f"Processed {products_processed} products...")
-
-# Create final DataFrame
-final_catalog = pd.DataFrame(merged_catalog)
-
-# Sort by Item Name
-final_catalog = final_catalog.sort_values('Item Name', na_position='last')
+# Stack all catalogs with a source label, keyed by cleaned product name
+all_df = pd.concat(
+    [df.assign(_source=source) for source, df in merge_inputs.items()], ignore_index=True
+)
+# Clean and standardize product names in one column pass
+all_df['_clean'] = all_df['Item Name'].astype('string').str.lower().str.strip().fillna('')
+all_df = all_df[all_df['_clean'].ne('')]
+# Low-cardinality labels group and compare on integer codes as categoricals
+all_df['_source'] = pd.Categorical(all_df['_source'], categories=list(catalogs))
+all_df['Categories'] = all_df['Categories'].astype('category')
+
+# Products with more than one row across the catalogs
+merge_count = (all_df.groupby('_clean').size() > 1).sum()
+
+# Each catalog's first row for a name is its candidate
+candidates = all_df.drop_duplicates(['_clean', '_source'])
+by_name = candidates.groupby('_clean')
+
+# Start with the most complete base (usually Square for structure)
+final_catalog = candidates.drop_duplicates('_clean').set_index('_clean')
+
+# DESCRIPTION - Choose the best one (ties go to the earlier catalog)
+desc_best = candidates.loc[by_name['_desc_score'].idxmax()].set_index('_clean')
+desc_best = desc_best.loc[desc_best['_desc_score'] > 0, ['Description', '_source']]
+
+# SEO TITLE & DESCRIPTION - Choose the best set
+seo_best = candidates.loc[by_name['_seo_score'].idxmax()].set_index('_clean')
+seo_best = seo_best.loc[seo_best['_seo_score'] > 0, ['SEO Title', 'SEO Description', '_source']]
+
+# CATEGORIES - Prefer Palka's curated categories if available, then Square's
+cat_rank = candidates['_source'].map({'palka': 0, 'square': 1}).astype(float)
+cat_best = candidates[cat_rank.notna() & candidates['Categories'].notna()]
+cat_best = cat_best.loc[cat_rank[cat_best.index].sort_values(kind='stable').index]
+cat_best = cat_best.drop_duplicates('_clean').set_index('_clean')[['Categories', '_source']]
+
+# Write the winning fields over the base rows, one column at a time
+note_sources = {}
+for best, note, fields in [
+    (desc_best, 'desc', ['Description']),
+    (seo_best, 'seo', ['SEO Title', 'SEO Description']),
+    (cat_best, 'cat', ['Categories']),
+]:
+    for field in fields:
+        final_catalog.loc[best.index, field] = best[field]
+    note_sources[note] = best['_source'].reindex(final_catalog.index)
+
+# Add merge metadata
+# Source set per product as a bitmask over the catalogs (bit i = i-th catalog);
+# only spelled out as text right before writing
+source_bits = pd.Series(1 << candidates['_source'].cat.codes.to_numpy(), index=candidates['_clean'])
+final_catalog['_merge_sources'] = source_bits.groupby(level=0).sum()
+# Merge notes are appended one note column at a time, skipping missing winners
+merge_notes = pd.Series('', index=final_catalog.index, dtype='string')
+for note, source in note_sources.items():
+    part = note + ':' + source.astype('string')
+    merge_notes = (merge_notes + ', ' + part).where(merge_notes != '', part).where(part.notna(), merge_notes)
+final_catalog['_merge_notes'] = merge_notes.astype('category')
+
+# Re-join the untouched columns from each product's base row
+extras = []
+for source, df in catalogs.items():
+    base = final_catalog[final_catalog['_source'] == source]
+    extras.append(df.loc[base['_row'], df.columns.difference(MERGE_COLUMNS, sort=False)].set_axis(base.index))
+final_catalog = final_catalog.join(pd.concat(extras))
+
+# Sort by the cleaned name key, then restore the catalogs' column order and
+# drop the scoring and merge helpers
+final_catalog = final_catalog.sort_index(kind='mergesort')
+columns = pd.concat([df.head(0) for df in catalogs.values()]).columns.tolist()
+final_catalog = final_catalog.reset_index(drop=True)[columns + ['_merge_sources', '_merge_notes']]
+
+# Spell out the source sets once per distinct combination
+source_labels = {
+    mask: ', '.join(source for bit, source in enumerate(catalogs) if mask >> bit & 1)
+    for mask in final_catalog['_merge_sources'].unique()
+}
+final_catalog['_merge_sources'] = final_catalog['_merge_sources'].map(source_labels).astype('category')
 
 # Save the merged catalog
 output_filename = f'MERGED_COMPREHENSIVE_CATALOG_{datetime.now().strftime("%Y-%m-%d_%H%M")}.xlsx'
-final_catalog.to_excel(output_filename, index=False)
+# Also leaves a Parquet copy for the review/update scripts
+save_catalog(final_catalog, output_filename)
 
 print(f"\n{'='*80}")
 print(f"MERGE COMPLETE!")
@@ -179,40 +142,28 @@ print(f"Output saved to: {output_filename}")
 
 # Show merge statistics
 print("\nMerge Statistics:")
-desc_sources = [note.split(':')[1] for note in final_catalog['_merge_notes'] if 'desc:' in str(note)]
-seo_sources = [note.split(':')[1] for note in final_catalog['_merge_notes'] if 'seo:' in str(note)]
-cat_sources = [note.split(':')[1] for note in final_catalog['_merge_notes'] if 'cat:' in str(note)]
-
-if desc_sources:
-    print(f"\nDescription sources:")
-    for source in ['square', 'palka', 'tbd']:
-        count = desc_sources.count(source)
-        if count > 0:
-            print(f"  - {source}: {count} products")
-
-if seo_sources:
-    print(f"\nSEO data sources:")
-    for source in ['square', 'palka', 'tbd']:
-        count = seo_sources.count(source)
-        if count > 0:
-            print(f"  - {source}: {count} products")
-
-if cat_sources:
-    print(f"\nCategory sources:")
-    for source in ['square', 'palka', 'tbd']:
-        count = cat_sources.count(source)
-        if count > 0:
-            print(f"  - {source}: {count} products")
+note_counts = (
+    final_catalog['_merge_notes'].astype('string')
+    .str.extractall(r'(desc|seo|cat):(\w+)')
+    .value_counts()
+)
+
+for note, heading in [('desc', 'Description sources'), ('seo', 'SEO data sources'), ('cat', 'Category sources')]:
+    if note in note_counts.index.get_level_values(0):
+        print(f"\n{heading}:")
+        for source, count in note_counts[note].reindex(['square', 'palka', 'tbd']).dropna().items():
+            print(f"  - {source}: {int(count)} products")
 
 # Show sample of merged products
 print("\n\nSample of merged products with multiple sources:")
 multi_source = final_catalog[final_catalog['_merge_sources'].str.contains(',')].head(5)
-for idx, row in multi_source.iterrows():
+desc_preview = multi_source['Description'].astype('string').fillna('').str[:100]
+has_seo_title = multi_source['SEO Title'].notna()
+for (idx, row), desc, has_title in zip(multi_source.iterrows(), desc_preview, has_seo_title):
     print(f"\n- {row['Item Name']}")
     print(f"  Sources: {row['_merge_sources']}")
     print(f"  Merge notes: {row['_merge_notes']}")
-    desc = str(row.get('Description', ''))
-    if desc and desc != 'nan':
-        print(f"  Description: {desc[:100]}...")
-    if not pd.isna(row.get('SEO Title', '')):
+    if desc:
+        print(f"  Description: {desc}...")
+    if has_title:
         print(f"  SEO Title: {row['SEO Title']}")
@@ -1,43 +1,46 @@
-import pandas as pd
 import json
 from datetime import datetime
+from catalog_cache import load_catalog
 
-# Load the merged catalog
-df = pd.read_excel('organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx')
+# Load the merged catalog (cached as Parquet after the first read)
+df = load_catalog('organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx')
 
 # Filter products that need SEO
 needs_seo = df[(df['SEO Title'].isna()) | (df['SEO Description'].isna())]
 print(f"Found {len(needs_seo)} products that need SEO enhancement\n")
 
-# Create a list to store our manual SEO updates
-seo_updates = []
-
 # Show first 10 products that need SEO
 print("=== PRODUCTS NEEDING SEO (First 10) ===\n")
-for idx, (i, product) in enumerate(needs_seo.head(10).iterrows()):
+review = needs_seo.head(10)
+# Prepare the display text for the whole review block up front
+descriptions = review['Description'].astype('string').fillna('')
+desc_lengths = descriptions.str.len()
+desc_text = descriptions.where(desc_lengths <= 300, descriptions.str[:300] + "...")
+review_rows = review[['Item Name', 'Price', 'Categories', 'SEO Title', 'SEO Description']].assign(
+    desc=desc_text, desc_len=desc_lengths
+)
+for idx, (name, price, category, seo_title, seo_desc, desc, desc_len) in enumerate(
+    review_rows.itertuples(index=False, name=None)
+):
     print(f"\n{'='*80}")
-    print(f"#{idx+1}. {product['Item Name']}")
+    print(f"#{idx+1}. {name}")
     print(f"{'='*80}")
-    print(f"Price: ${product.get('Price', 'N/A')}")
-    print(f"Category: {product.get('Categories', 'N/A')}")
+    print(f"Price: ${price}")
+    print(f"Category: {category}")
     
-    desc = str(product.get('Description', ''))
-    print(f"\nDescription ({len(desc)} chars):")
-    if len(desc) > 300:
-        print(desc[:300] + "...")
-    else:
-        print(desc)
+    print(f"\nDescription ({desc_len} chars):")
+    print(desc)
     
     print(f"\nCurrent SEO Status:")
-    print(f"- Title: {product.get('SEO Title', 'MISSING')}")
-    print(f"- Description: {product.get('SEO Description', 'MISSING')}")
-    
-    # Store for manual updates
-    seo_updates.append({
-        'index': i,
-        'name': product['Item Name'],
-        'needs_seo': True
-    })
+    print(f"- Title: {seo_title}")
+    print(f"- Description: {seo_desc}")
+
+# Store the reviewed products for manual updates
+seo_updates = (
+    review['Item Name'].rename('name').rename_axis('index').reset_index()
+    .assign(needs_seo=True)
+    .to_dict(orient='records')
+)
 
 # Save the list of products needing SEO
 with open('products_needing_seo.json', 'w') as f:
@@ -1,9 +1,11 @@
 import pandas as pd
+import numpy as np
 import json
 from datetime import datetime
+from catalog_cache import load_catalog, save_catalog
 
-# Load the catalog
-df = pd.read_excel('organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx')
+# Load the catalog (cached as Parquet after the first read)
+df = load_catalog('organized-inventory/00-active-working/MERGED_COMPREHENSIVE_CATALOG_2025-08-03.xlsx')
 
 # Define our manually crafted SEO for each product
 seo_updates = [
@@ -69,20 +71,31 @@ seo_updates = [
     }
 ]
 
-# Update the dataframe with our SEO
+# Update the dataframe with our SEO, looking products up by name
 print("🔄 Updating catalog with tailored SEO...\n")
-updated_count = 0
+# One timestamp for the whole batch, reused for _seo_updated and the file name
+now = datetime.now()
+updates = pd.DataFrame(seo_updates).drop_duplicates('name', keep='last').set_index('name')
 
+# Only the first row for each product name is updated
+names = df['Item Name']
+positions = updates.index.get_indexer(names)
+m = (positions >= 0) & ~names.duplicated().to_numpy()
+matched = updates.iloc[positions[m]]
+
+# Write all four fields for the matched rows in one assignment; columns
+# that loaded entirely blank come back as float, so hold them as object
+seo_columns = ['SEO Title', 'SEO Description', '_seo_keywords', '_seo_updated']
+df = df.astype({col: object for col in seo_columns if col in df})
+df.loc[m, seo_columns] = np.column_stack([
+    matched[['seo_title', 'seo_description', 'keywords']].to_numpy(),
+    np.full(len(matched), now.isoformat(), dtype=object),
+])
+updated_count = int(m.sum())
+
+updated_names = set(matched.index)
 for update in seo_updates:
-    # Find the product
-    mask = df['Item Name'] == update['name']
-    if mask.any():
-        idx = df[mask].index[0]
-        df.loc[idx, 'SEO Title'] = update['seo_title']
-        df.loc[idx, 'SEO Description'] = update['seo_description']
-        df.loc[idx, '_seo_keywords'] = update['keywords']
-        df.loc[idx, '_seo_updated'] = datetime.now().isoformat()
-        updated_count += 1
+    if update['name'] in updated_names:
         print(f"✅ Updated: {update['name'][:50]}...")
         print(f"   Title: {update['seo_title']}")
         print(f"   Desc: {update['seo_description'][:80]}...\n")
@@ -90,8 +103,8 @@ for update in seo_updates:
         print(f"❌ Not found: {update['name']}")
 
 # Save the updated catalog
-output_path = f'organized-inventory/00-active-working/CATALOG_WITH_SEO_BATCH1_{datetime.now().strftime("%Y%m%d_%H%M")}.xlsx'
-df.to_excel(output_path, index=False)
+output_path = f'organized-inventory/00-active-working/CATALOG_WITH_SEO_BATCH1_{now.strftime("%Y%m%d_%H%M")}.xlsx'
+save_catalog(df, output_path)
 
 print(f"\n✨ Updated {updated_count} products with tailored SEO")
 print(f"📄 Saved to: {output_path}")